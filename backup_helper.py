@@ -2,7 +2,7 @@
 Sequencing backup helper
 =========================
 This provides a nice interface to do two things:
-    1. Compute the SHA256 hash of files on a hard drive, and...
+    1. Compute the SHA256 (or other) hash of files on a hard drive, and...
     2. Compare file hashes to the stored hashes.
     3. Run `par2` on the files to generate and/or verify parity data.
 
@@ -11,19 +11,45 @@ You can do all of these things manually!
 This also only requires standard library packages, so you don't need
 a virtual environment.
 """
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import functools
 import json
 from pathlib import Path
 import argparse
-from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
 import hashlib
-import math
+import mmap
+import os
 import shutil
 import sys
+import tempfile
 import subprocess
-import re
+import queue
+import threading
+import time
 
-VERSION = (1,0,0)
+try:
+    # Optional: orjson is much faster for large manifests, but is not required.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: only needed for backup sets initialized with `--hash-algo blake3`.
+    import blake3
+except ImportError:
+    blake3 = None
+
+VERSION = (2,0,0)
+
+# Hash algorithms that a backup set can be initialized with. SHA256 is the default,
+# as it can be checked by hand with standard tools (e.g. Get-FileHash).
+HASH_ALGORITHMS = ('sha256', 'blake2b', 'blake3')
+
+# Default chunk size for hashing. Large enough to keep per-chunk overhead negligible,
+# small enough that each chunk is still cache-resident when it is hashed.
+_OPTIMAL_HASH_CHUNK = 1 << 20
 
 
 
@@ -36,6 +62,8 @@ class JSONDataManifest:
     name: str
     backup_set: List[str]
     files: dict[str, str]
+    # Manifests from before 2.0.0 have no algorithm listed, and are all SHA256
+    algo: str = 'sha256'
 
 @dataclass
 class DataManifest:
@@ -48,7 +76,9 @@ class DataManifest:
     version: Tuple[int, int, int]
     name: str
     backup_set: List[str]
-    files: dict[Path, str]
+    # Raw digests; the JSON manifest stores them as hex strings
+    files: dict[Path, bytes]
+    algo: str = 'sha256'
 
 @dataclass
 class FileStatus:
@@ -62,10 +92,34 @@ class FileStatus:
     has_par2_files: bool
     has_file: bool
 
+@dataclass
+class VerifiedFileStat:
+    """
+    Stores the on-disk state of a file when its hash was last successfully
+    verified, so that unchanged files can skip re-hashing
+    """
+    hash: bytes
+    size: int
+    mtime_ns: int
+    # Unix timestamp of the last successful hash verification
+    last_verified: float
+
 # ----- Pretty-printing helper functions --------
+_print_lock = threading.Lock()
+
+def locked_print(*args: Any, **kwargs: Any) -> None:
+    """
+    Prints while holding a lock, so that lines printed from concurrent workers don't interleave
+    """
+    with _print_lock:
+        print(*args, **kwargs)
+
 def version_string(version: Tuple[int,int,int]) -> str:
     return ".".join([str(x) for x in version])
 
+_BYTE_UNITS = ('B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB')
+_BYTE_DIVISORS = tuple(1 << (10 * i) for i in range(len(_BYTE_UNITS)))
+
 def format_bytes(n_bytes: int) -> str:
     """
     Pretty-formats a given number of bytes
@@ -73,63 +127,263 @@ def format_bytes(n_bytes: int) -> str:
     if n_bytes == 0:
         return '0 B'
 
-    negative = False
+    sign = ''
     if n_bytes < 0:
-        negative = True
+        sign = '-'
         n_bytes = -n_bytes 
     
-    unit_idx = math.floor(math.log(n_bytes, 1024))
-    unit = ['B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB'][unit_idx]
-    return f'{round(n_bytes / 1024 ** unit_idx, 2)} {unit}'
+    # Integer floor(log_1024(n_bytes)), clamped to the largest unit
+    unit_idx = min((n_bytes.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f'{sign}{round(n_bytes / _BYTE_DIVISORS[unit_idx], 2)} {_BYTE_UNITS[unit_idx]}'
     
+def _hash_double_buffered(file: BinaryIO, hash: Any, bufsize: int, on_read: Callable[[int], None]) -> None:
+    """
+    Feeds `file` into `hash`, reading the next chunk on a background thread while
+    the current chunk is hashed. hashlib releases the GIL while hashing, so this
+    keeps both the disk and the CPU busy. `on_read` is called with the size of each
+    chunk, ending with a zero at EOF.
+    """
+    # Two buffers are passed back and forth: one being filled, one being hashed.
+    empty: 'queue.Queue[Optional[bytearray]]' = queue.Queue()
+    filled: 'queue.Queue[Tuple[bytearray, int, Optional[BaseException]]]' = queue.Queue()
+    for _ in range(2):
+        empty.put(bytearray(bufsize))
+
+    def reader() -> None:
+        while True:
+            buffer = empty.get()
+            if buffer is None:
+                return
+            try:
+                n_read = file.readinto(buffer)
+            except BaseException as e:
+                filled.put((buffer, 0, e))
+                return
+            filled.put((buffer, n_read, None))
+            if n_read == 0:
+                return
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        while True:
+            buffer, n_read, error = filled.get()
+            if error is not None:
+                raise error
+            on_read(n_read)
+            if n_read == 0:
+                break
+            hash.update(memoryview(buffer)[:n_read])
+            empty.put(buffer)
+    finally:
+        # Stop the reader (if it hasn't hit EOF) before the caller closes the file
+        empty.put(None)
+        thread.join()
+
+def new_hash(algo: str) -> Any:
+    """
+    Creates a new hash object for one of the supported HASH_ALGORITHMS
+    """
+    if algo == 'blake3':
+        if blake3 is None:
+            raise RuntimeError("This backup set uses blake3 hashes, which requires the `blake3` package. "
+                "Install it with `pip install blake3`.")
+        # Let blake3 hash large chunks using multiple threads
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    if algo not in HASH_ALGORITHMS:
+        raise RuntimeError(f"Unknown hash algorithm {algo}! Supported algorithms: {', '.join(HASH_ALGORITHMS)}")
+    # These hashes are integrity checks, not security checks. This also lets OpenSSL 3
+    # pick its fastest implementation (e.g. SHA-NI) without FIPS bookkeeping.
+    return hashlib.new(algo, usedforsecurity=False)
+
+def open_for_sequential_read(filename: Path) -> BinaryIO:
+    """
+    Opens a file for reading in binary mode, hinting to the OS that it will be read sequentially.
+    On Windows, O_SEQUENTIAL sets FILE_FLAG_SEQUENTIAL_SCAN, which makes the cache manager read ahead aggressively.
+    On Linux, POSIX_FADV_SEQUENTIAL does the same by enlarging the read-ahead window.
+    """
+    fd = os.open(filename, os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0))
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            # Only a hint, so reading works just the same without it
+            pass
+    return os.fdopen(fd, 'rb')
+
+def drop_cached_pages(filename: Path) -> None:
+    """
+    Tells the OS that a file's cached pages won't be read again, so that reading through
+    large backup files doesn't evict everything else from the page cache. Only call this once
+    every reader (including par2) is done with the file. Does nothing without `posix_fadvise` (e.g. Windows).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(filename, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        # Only a hint; failing here must not abort an add or verify
+        pass
+    finally:
+        os.close(fd)
+
 def hash_file_with_progress(
         filename: Path, *,
-        bufsize: int = 1024 * 1024 * 4,
-        display_freq: int = 10,
+        algo: str = 'sha256',
+        bufsize: int = _OPTIMAL_HASH_CHUNK,
+        small_file_size: int = 1024 * 1024 * 64,
+        display_interval: float = 0.1,
         progress_width: int = 50,
-        ) -> str:
-    """
-    SHA256-hashes a given file by filename,
-    showing a progress bar as hashing proceeds
+        show_progress: bool = True,
+        ) -> bytes:
     """
+    Hashes a given file by filename using `algo` (SHA256 by default),
+    showing a progress bar as hashing proceeds. Returns the raw digest.
 
-    hash = hashlib.sha256()
-    # Read in 4MB chunks. Actual size doesn't matter too much...
-    
+    Files up to `small_file_size` are hashed in one go, by `hashlib.file_digest` on Python 3.11+.
+    Larger files are memory-mapped and hashed in `bufsize` slices where possible.
+    Otherwise, they are read in `bufsize` chunks on a background thread, overlapping
+    the disk reads with hashing. Either way, the progress bar is redrawn at most
+    once every `display_interval` seconds.
+
+    `bufsize` should be a multiple of the filesystem block size (almost always 4 KiB).
+
+    The progress bar should be disabled when hashing several files concurrently,
+    as the bars would overwrite each other.
+    """
     filesize = filename.stat().st_size
+    filesize_str = format_bytes(filesize)
     processed_size = 0
-
-    print('\n', flush=True)
-    with filename.open('rb') as f:
-        i = display_freq
-        done = False
-        while True:
-            data = f.read(bufsize)
-            if not data:
-                # Do done trick so we output the final output tick
-                done = True
+    last_display = time.monotonic()
+    # Write each progress line as one pre-encoded write to the binary stdout, skipping print()'s
+    # per-call encoding and separate writes. The buffer layer (unlike os.write) still handles
+    # the Windows console correctly.
+    stdout_buffer = getattr(sys.stdout, 'buffer', None)
+    stdout_encoding = sys.stdout.encoding or 'utf8'
+
+    def on_read(n_read: int) -> None:
+        nonlocal processed_size, last_display
+        processed_size += n_read
+        if not show_progress:
+            return
+        # A zero-length read means we hit EOF, so always output the final tick
+        if n_read > 0:
+            now = time.monotonic()
+            if now - last_display < display_interval:
+                return
+            last_display = now
+            processed_str = f'{processed_size >> 20} MiB'
+        else:
+            processed_str = format_bytes(processed_size)
+        n_hashes = int(progress_width * processed_size / filesize) if filesize > 0 else progress_width
+        line = f"{filename.name}: [{'#' * n_hashes}{'.' * (progress_width - n_hashes)}] {processed_str} / {filesize_str}\r"
+        if stdout_buffer is None:
+            print(line, end='', flush=True)
+        else:
+            stdout_buffer.write(line.encode(stdout_encoding, errors='replace'))
+            stdout_buffer.flush()
+
+    if show_progress:
+        print('\n', flush=True)
+    with open_for_sequential_read(filename) as f:
+        if filesize <= small_file_size:
+            # Small files are done quickly, so skip setting up a mapping or reader thread
+            # and let hashlib.file_digest run the whole read loop. Just show the final tick.
+            if hasattr(hashlib, 'file_digest'):
+                hash = hashlib.file_digest(f, lambda: new_hash(algo))
             else:
-                processed_size += len(data)
-                hash.update(data)
-
-            i -= 1
-            if i == 0 or done:
-                i = display_freq
-                n_hashes = int(progress_width * processed_size / filesize)
-                print("{}: [{}{}] {} / {}".format(
-                    filename.name,
-                    '#' * n_hashes,
-                    '.' * (progress_width - n_hashes),
-                    format_bytes(processed_size),
-                    format_bytes(filesize)
-                ), end='\r', flush=True)
-            if done:
-                break
-    print('\n', flush=True)
+                hash = new_hash(algo)
+                hash.update(f.read())
+            # For empty files, the EOF tick alone draws the (full) bar
+            if filesize > 0:
+                on_read(filesize)
+            on_read(0)
+        else:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OverflowError, OSError):
+                # Some filesystems (and 32-bit Pythons, for large files) cannot map files. Fall back to reads.
+                mapped = None
+
+            if mapped is not None:
+                # Hash directly out of the page cache, skipping the copy into a Python bytes object
+                hash = new_hash(algo)
+                with mapped, memoryview(mapped) as view:
+                    # madvise is not available on Windows
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    for offset in range(0, len(mapped), bufsize):
+                        with view[offset:offset + bufsize] as chunk:
+                            hash.update(chunk)
+                            on_read(len(chunk))
+                    on_read(0)
+            else:
+                hash = new_hash(algo)
+                _hash_double_buffered(f, hash, bufsize, on_read)
+    if show_progress:
+        print('\n', flush=True)
     
-    return hash.hexdigest()
+    return hash.digest()
 
 # ----- Actual helper implementation functions --------
+def load_json(filename: Path) -> Any:
+    """
+    Loads a JSON file, using `orjson` if it is installed.
+    Parses from bytes, so that decoding is always UTF-8 regardless of platform locale.
+    """
+    data = filename.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def save_json(filename: Path, data: Any) -> None:
+    """
+    Saves indented JSON with sorted keys, using `orjson` if it is installed.
+    Both paths produce identical output.
+    """
+    if orjson is not None:
+        # orjson already produces UTF-8 bytes; write them as-is rather than round-tripping through str
+        filename.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        return
+    with filename.open('w', encoding='utf8') as f:
+        json.dump(data, f, indent=2, sort_keys=True, ensure_ascii=False)
+
+def drive_relative_path(root: Path, file: Path) -> Path:
+    """
+    Returns the path of `file` relative to the (already resolved) drive root.
+    Files that were built by joining a relative path onto the root skip `resolve()`,
+    which costs several syscalls per file.
+    """
+    try:
+        rel_file = file.relative_to(root)
+        if '..' not in rel_file.parts:
+            return rel_file
+    except ValueError:
+        pass
+    try:
+        return file.resolve().relative_to(root)
+    except ValueError:
+        raise RuntimeError(f"Requested file {str(file)} is not within the current backup drive root!")
+
+def split_par2_name(name: str) -> Optional[Tuple[str, Optional[Tuple[int, int]]]]:
+    """
+    Splits a par2 filename into the name of the file it protects, and (for recovery volumes)
+    the first block and block count. For example, `foo.zip.vol03+04.par2` gives `('foo.zip', (3, 4))`
+    and `foo.zip.par2` gives `('foo.zip', None)`. Returns None if this is not a par2 file.
+
+    This uses plain string operations instead of a regex, as it runs once per file in the data tree.
+    """
+    if not name.endswith('.par2'):
+        return None
+    stem = name[:-len('.par2')]
+    base, vol_sep, volume = stem.rpartition('.vol')
+    first_block, plus_sep, block_count = volume.partition('+')
+    if vol_sep and plus_sep and first_block.isdecimal() and block_count.isdecimal():
+        return base, (int(first_block), int(block_count))
+    return stem, None
+
 def load_manifest(root: Path) -> Optional[DataManifest]:
     """
     Attempts to load a JSON manifest from the root path.
@@ -140,13 +394,19 @@ def load_manifest(root: Path) -> Optional[DataManifest]:
         return None
     
     try:
-        with manifest_filename.open('r') as file:
-            raw_manifest = JSONDataManifest(**json.load(file))
+        raw_manifest = JSONDataManifest(**load_json(manifest_filename))
+        # Convert the file list by draining the raw dict, so each raw key is released as it is
+        # converted instead of holding both copies of a large manifest in memory at once.
+        files: Dict[Path, bytes] = {}
+        while raw_manifest.files:
+            k, v = raw_manifest.files.popitem()
+            files[Path(k)] = bytes.fromhex(v)
         manifest = DataManifest(
             version=tuple(map(int, (raw_manifest.version.split('.')))),
             name=raw_manifest.name,
             backup_set=raw_manifest.backup_set,
-            files={Path(k): v for k,v in raw_manifest.files.items()}
+            files=files,
+            algo=raw_manifest.algo,
         )
 
         if manifest.version > VERSION:
@@ -160,23 +420,64 @@ def load_manifest(root: Path) -> Optional[DataManifest]:
 
 def save_manifest(root: Path, manifest: DataManifest) -> None:
     """
-    Saves the given manifest back to the current root, using the current version
+    Saves the given manifest back to the current root, using the current version.
+    Uses `orjson` if it is installed, which is much faster for large manifests.
+    """
+    # Build the JSONDataManifest fields directly instead of deep-copying with asdict
+    towrite = {
+        'version': version_string(manifest.version),
+        'name': manifest.name,
+        'backup_set': manifest.backup_set,
+        'files': {str(k): v.hex() for k,v in manifest.files.items()},
+    }
+    # Versions before 2.0.0 only know SHA256 and reject unknown fields, so only record other algorithms.
+    # Those can only come from `init` in 2.0.0+, whose version number makes older versions ask for a `git pull`.
+    if manifest.algo != 'sha256':
+        towrite['algo'] = manifest.algo
+    save_json(root / 'manifest.json', towrite)
+
+def _manifest_fingerprint(files: Dict[Path, bytes]) -> bytes:
+    """
+    Returns a digest of a manifest's file list, for cheaply checking that drives track identical files.
+    """
+    fingerprint = hashlib.sha256()
+    for k in sorted(files):
+        fingerprint.update(str(k).encode('utf8') + b'\0' + files[k] + b'\n')
+    return fingerprint.digest()
+
+def load_verify_cache(root: Path) -> Dict[Path, VerifiedFileStat]:
+    """
+    Loads the per-drive cache of file sizes and modification times recorded at the
+    last successful hash verification. Returns an empty cache if it does not exist or is unreadable.
     """
-    towrite = JSONDataManifest(
-        version=version_string(manifest.version),
-        name=manifest.name,
-        backup_set=manifest.backup_set,
-        files={str(k): v for k,v in manifest.files.items()}
-    )
-    with (root / 'manifest.json').open('w') as f:
-        json.dump(asdict(towrite), f, indent=2, sort_keys=True)
+    cache_filename = root / 'verify_cache.json'
+    if not cache_filename.exists():
+        return {}
+    try:
+        return {Path(k): VerifiedFileStat(**{**v, 'hash': bytes.fromhex(v['hash'])}) for k, v in load_json(cache_filename).items()}
+    except Exception as e:
+        print(f'Ignoring unreadable verification cache {cache_filename}: {e}')
+        return {}
 
+def save_verify_cache(root: Path, verify_cache: Dict[Path, VerifiedFileStat]) -> None:
+    """
+    Saves the per-drive verification cache. This lives next to (not inside) the manifest,
+    as file modification times differ between the drives in a backup set.
+    """
+    save_json(root / 'verify_cache.json', {str(k): {**vars(v), 'hash': v.hash.hex()} for k, v in verify_cache.items()})
+
+@functools.lru_cache(maxsize=1)
 def locate_par2() -> Path:
     """
     Locates the par2 executable, either globally installed
     or located within the repo (inside `bin`).
+
+    The result is cached, so the PATH is only searched once per run.
     """
     repo_dir = Path(__file__).parent
+    # Prefer par2cmdline-turbo (a faster, drop-in replacement for par2cmdline) if it was put in the bin folder
+    if sys.platform == 'win32' and (repo_dir / 'bin' / 'par2-turbo.exe').exists():
+        return repo_dir / 'bin' / 'par2-turbo.exe'
     par2_in_path = shutil.which('par2')
     par2 = Path(par2_in_path) if par2_in_path is not None else None
     if par2 is None:
@@ -193,10 +494,25 @@ def locate_par2() -> Path:
         )
     return par2
 
+@functools.lru_cache(maxsize=1)
+def par2_thread_args() -> List[str]:
+    """
+    Returns the arguments that make `par2 create` compute recovery data on all CPU cores,
+    or no arguments if the located par2 does not support threading (it predates par2cmdline 0.8).
+    The result is cached, so par2 is only queried once per run.
+    """
+    try:
+        usage = subprocess.run([str(locate_par2()), '-h'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT).stdout
+    except OSError:
+        return []
+    if b'-t<n>' not in usage:
+        return []
+    return [f'-t{os.cpu_count() or 1}']
+
 # ------ Subfunction implementation functions --------
-def init_paired_backups(root: Path, name: str, backup_set: List[str]) -> None:
+def init_paired_backups(root: Path, name: str, backup_set: List[str], algo: str = 'sha256') -> None:
     """
-    Initializes the paired backup system, given a root path, name, and paired name.
+    Initializes the paired backup system, given a root path, name, paired name, and hash algorithm.
     """
     # Abort if a manifest already exists
     if (root / 'manifest.json').exists():
@@ -205,118 +521,187 @@ def init_paired_backups(root: Path, name: str, backup_set: List[str]) -> None:
     if not (root / 'data').exists():
         (root / 'data').mkdir()
     # Write an empty manifest 
-    save_manifest(root, DataManifest(VERSION, name, backup_set, {}))
+    save_manifest(root, DataManifest(VERSION, name, backup_set, {}, algo))
 
-def add_file(root: Path, manifest: DataManifest, file: Path, *, parity_percent: int, reuse_parity: bool = False, start_block: int = 0) -> int:
+def check_addable(root: Path, manifest: DataManifest, rel_file: Path, *, reuse_parity: bool = False) -> bool:
     """
-    Adds a file to the (single) linked manifest, and uses Par2 to compute parity information.
-    Returns next block needed with parity file.
+    Checks that a root-relative file can be added to the (single) linked manifest. This is cheap,
+    so it should run before any hashing or par2 work starts.
+    Returns True if the file already has parity data that should be reused.
     """
-    # Get the root-relative path
-    try:
-        rel_file = file.resolve().relative_to(root)
-    except ValueError:
-        raise RuntimeError(f"Requested file {str(file)} is not within the current backup drive root!")
-    
     if rel_file in manifest.files:
-        raise RuntimeError(f"Requested file {str(file)} is already on drive {manifest.name}")
-    
-    # Hash the file first:
-    print(f'[{manifest.name}] Computing hash for {str(rel_file)}:')
-    filehash = hash_file_with_progress(file)
+        raise RuntimeError(f"Requested file {str(rel_file)} is already on drive {manifest.name}")
 
     if (root / rel_file.with_name(rel_file.name + '.par2')).exists():
         if not reuse_parity:
-            raise RuntimeError(f"Requested file {str(file)} already has parity data! "
+            raise RuntimeError(f"Requested file {str(rel_file)} already has parity data! "
                 "Something weird is happening! Use --reuse-parity to reuse parity data if this is intentional")
-    else:
-        # Launch par2
-        launch_args = [str(locate_par2()), 'create', f'-r{parity_percent}', f'-f{start_block}', str(file.name)]
-        wd = file.parent
-        print(f'Running `{" ".join(launch_args)}` in directory {str(wd)}')
-        subprocess.run(launch_args, check=True, cwd=wd)
-    
+        return True
+    return False
+
+def start_parity(manifest: DataManifest, file: Path, *, parity_percent: int, start_block: int = 0) -> subprocess.Popen:
+    """
+    Launches Par2 to compute parity information for a file (already checked by `check_addable`)
+    in the background. Pass the running process to `finish_parity`.
+    """
+    launch_args = [str(locate_par2()), 'create', *par2_thread_args(), f'-r{parity_percent}', f'-f{start_block}', str(file.name)]
+    wd = file.parent
+    locked_print(f'[{manifest.name}] Running `{" ".join(launch_args)}` in directory {str(wd)}', flush=True)
+    return subprocess.Popen(launch_args, cwd=wd)
+
+def finish_parity(root: Path, file: Path, par2_process: Optional[subprocess.Popen]) -> int:
+    """
+    Waits for a par2 process started by `start_parity` to finish (if any; None means existing parity data is reused).
+    Returns next block needed with parity file.
+    """
+    if par2_process is not None:
+        par2_process.wait()
+        if par2_process.returncode != 0:
+            raise subprocess.CalledProcessError(par2_process.returncode, par2_process.args)
+
+    rel_file = drive_relative_path(root, file)
     next_block = 0
-    for file in (root / rel_file).parent.glob(f'{rel_file.name}.vol*.par2'):
-        match = re.match(r".*\.vol(\d+)\+(\d+).par2", file.name)
-        if match is None:
+    for par2_file in (root / rel_file).parent.glob(f'{rel_file.name}.vol*.par2'):
+        par2_name = split_par2_name(par2_file.name)
+        if par2_name is None or par2_name[1] is None:
             continue
-        possible_next_block = int(match.group(1)) + int(match.group(2))
+        first_block, block_count = par2_name[1]
+        possible_next_block = first_block + block_count
         if possible_next_block > next_block:
             next_block = possible_next_block
-
-    # Update the manifest
-    if rel_file in manifest.files and manifest.files[rel_file] != filehash:
-        raise RuntimeError(f"File hash mismatch when adding file! For file {str(file)}\n"
-                f"Expected hash: {manifest.files[rel_file]}\n"
-                f"Actual hash: {filehash}"
-        )
-    manifest.files[rel_file] = filehash
     return next_block
 
-def verify_file(root: Path, manifest: DataManifest, file: Path) -> bool:
+def verify_file(root: Path, manifest: DataManifest, rel_file: Path, *, show_progress: bool = True,
+                verify_cache: Optional[Dict[Path, VerifiedFileStat]] = None, max_cache_age: float = 0.0,
+                check_hash: bool = True, deep: bool = True) -> bool:
     """
-    Verifies that a given file has the correct hash and proper `par2` recovery data.
+    Verifies that a given root-relative file (e.g. a manifest key) has the correct hash and proper `par2` recovery data.
+
+    `par2 verify` runs at the same time as the hashing, so that both read the file through
+    the page cache instead of reading it from disk twice. Passing `check_hash=False` skips the
+    hash check entirely, relying on the checksums `par2 verify` does. Passing `deep=False` stops
+    `par2 verify` as soon as the hash check fails, instead of also reporting on the recovery data.
+
+    If a `verify_cache` is passed, hashing is skipped for files whose size and modification time
+    are unchanged since their hash was verified, less than `max_cache_age` seconds ago. `par2 verify`
+    still runs on these files, so corruption is still detected. The cache is updated after
+    each successful hash check.
+
+    Output is printed as whole lines prefixed with the drive name, so this is safe
+    to run for several drives concurrently (with `show_progress` disabled).
     """
-    # Get the root-relative path
-    try:
-        rel_file = file.resolve().relative_to(root)
-    except ValueError:
-        raise RuntimeError(f"Requested file {str(file)} is not within the current backup drive root!")
-    
+    file = root / rel_file
+
     if rel_file not in manifest.files:
-        print(f'File {str(rel_file)} is missing hash information!')
+        locked_print(f'[{manifest.name}] File {str(rel_file)} is missing hash information!')
         return False
-    # Hash the file first:
-    print(f'[{manifest.name}] Computing hash for {str(rel_file)}:')
-    filehash = hash_file_with_progress(file)
-    bad = False
-    if filehash != manifest.files[rel_file]:
-        print(f'File {str(rel_file)} appears to be corrupted!\nExpected hash:{manifest.files[rel_file]}\nActual hash:{filehash}')
-        bad = True
 
-    # Launch par2
+    # Launch par2 in the background. Its output goes to a temporary file instead of a pipe,
+    # so it can't stall on a full pipe while we are busy hashing.
     launch_args = [str(locate_par2()), 'verify', file.name + '.par2']
     wd = file.parent
-    print(f'Running `{" ".join(launch_args)}` in directory {str(wd)}...', end='', flush=True)
-    run_result = subprocess.run(launch_args, check=False, cwd=wd, capture_output=True)
-    if run_result.returncode != 0:
-        print(run_result.stdout.decode('utf8'))
-        print(run_result.stderr.decode('utf8'))
-        print(f'\nFile {str(rel_file)} appears to be corrupted or have corrupted recovery data! See recovery instructions.')
-        bad = True
-    else:
-        print('done!', flush=True)
+    locked_print(f'[{manifest.name}] Running `{" ".join(launch_args)}` in directory {str(wd)}', flush=True)
+    bad = False
+    filehash: Optional[bytes] = None
+    with tempfile.TemporaryFile() as par2_output:
+        par2_process = subprocess.Popen(launch_args, cwd=wd, stdout=par2_output, stderr=subprocess.STDOUT)
+        try:
+            # Hash the file, if needed:
+            if check_hash:
+                stat = file.stat()
+                cached = verify_cache.get(rel_file) if verify_cache is not None else None
+                if (cached is not None and cached.hash == manifest.files[rel_file]
+                        and cached.size == stat.st_size and cached.mtime_ns == stat.st_mtime_ns
+                        and time.time() - cached.last_verified <= max_cache_age):
+                    locked_print(f'[{manifest.name}] Skipping hash for {str(rel_file)}: unchanged since it was verified at '
+                        f'{time.strftime("%Y-%m-%d %H:%M", time.localtime(cached.last_verified))}', flush=True)
+                    filehash = cached.hash
+                else:
+                    locked_print(f'[{manifest.name}] Computing hash for {str(rel_file)}:', flush=True)
+                    filehash = hash_file_with_progress(file, algo=manifest.algo, show_progress=show_progress)
+                    if verify_cache is not None and filehash == manifest.files[rel_file]:
+                        verify_cache[rel_file] = VerifiedFileStat(hash=filehash, size=stat.st_size, mtime_ns=stat.st_mtime_ns, last_verified=time.time())
+            if check_hash and filehash != manifest.files[rel_file]:
+                locked_print(f'[{manifest.name}] File {str(rel_file)} appears to be corrupted!\nExpected hash:{manifest.files[rel_file].hex()}\nActual hash:{filehash.hex()}')
+                bad = True
+                if not deep:
+                    # The file is already known to be bad, so don't wait for par2 to finish reading it
+                    par2_process.kill()
+        except BaseException:
+            par2_process.kill()
+            raise
+        finally:
+            par2_process.wait()
+        # Both the hash and par2 are done reading the file
+        drop_cached_pages(file)
+
+        if bad and not deep:
+            return False
+
+        if par2_process.returncode != 0:
+            par2_output.seek(0)
+            locked_print(par2_output.read().decode('utf8', errors='replace') + '\n' +
+                f'\n[{manifest.name}] File {str(rel_file)} appears to be corrupted or have corrupted recovery data! See recovery instructions.',
+                flush=True)
+            bad = True
+        else:
+            locked_print(f'[{manifest.name}] par2 verification passed for {str(rel_file)}', flush=True)
     
     return not bad
 
-def list_files(root: Path, manifest:DataManifest) -> List[FileStatus]:
+def scan_data_files(root: Path) -> Iterator[Tuple[str, str]]:
     """
-    Finds all files in the data directory with their basic status
+    Recursively yields the root-relative path (e.g. `data/foo/bar.zip`) and name of every file
+    in the data directory. This uses `os.scandir` directly, which avoids a `stat` and a `Path`
+    construction for every entry.
     """
-    results: Dict[Path, FileStatus] = {}
-    for file in (root / 'data').glob('**/*'):
-        rel_filename = file.resolve().relative_to(root)
-        if file.suffix == '.par2':
-            # Try to locate the base filename
-            basename_match = re.match(r"(.*?)(?:\.vol\d+\+\d+)?\.par2", file.name)
-            if basename_match is None:
-                raise RuntimeError(f"Unexpected par2 file: {str(rel_filename)}")
-            
-            basepath_rel = rel_filename.with_name(basename_match.group(1))
-            basepath = file.with_name(basename_match.group(1))
-            if basepath_rel not in results:
-                results[basepath_rel] = FileStatus(filename=basepath, rel_filename=basepath_rel,
-                                            has_hash=basepath_rel in manifest.files, has_par2_files=True, has_file=False)
-            else:
-                results[basepath_rel].has_par2_files = True
+    if not (root / 'data').is_dir():
+        return
+    pending_dirs = ['data']
+    while pending_dirs:
+        rel_dir = pending_dirs.pop()
+        with os.scandir(os.path.join(root, rel_dir)) as entries:
+            for entry in entries:
+                rel_path = f'{rel_dir}/{entry.name}'
+                if entry.is_dir(follow_symlinks=False):
+                    pending_dirs.append(rel_path)
+                else:
+                    yield rel_path, entry.name
+
+def list_files(root: Path, manifest:DataManifest, *, include_valid: bool = True) -> Tuple[int, List[FileStatus]]:
+    """
+    Finds all files in the data directory with their basic status.
+    Returns the number of valid (hashed, with parity data, and present) files, and the sorted file statuses.
+    If `include_valid` is False, valid files are only counted, which skips sorting them.
+    """
+    # Resolve the root once; paths below it are then built by string joins instead of per-entry resolves
+    root = root.resolve()
+    # scan_data_files gives forward-slash paths, so compare against the manifest as plain strings
+    # instead of hashing a new Path for every entry.
+    tracked_files = {k.as_posix() for k in manifest.files}
+    # Track [has_file, has_par2_files] by root-relative string. Each file usually has several par2 files,
+    # so Path objects are only built once per file, for the final results.
+    found: Dict[str, List[bool]] = {}
+    for rel_name, name in scan_data_files(root):
+        par2_name = split_par2_name(name)
+        if par2_name is not None:
+            # Locate the base filename
+            found.setdefault(rel_name[:-len(name)] + par2_name[0], [False, False])[1] = True
         else:
-            if rel_filename not in results:
-                results[rel_filename] = FileStatus(filename=file, rel_filename=rel_filename,
-                                            has_hash=rel_filename in manifest.files, has_par2_files=False, has_file=True)
-            else:
-                results[rel_filename].has_file = True
-    return sorted(results.values(), key=lambda v: (v.has_hash, v.has_file, v.has_par2_files, v.rel_filename))
+            found.setdefault(rel_name, [False, False])[0] = True
+
+    valid_count = 0
+    results: List[FileStatus] = []
+    for rel_name, (has_file, has_par2_files) in found.items():
+        has_hash = rel_name in tracked_files
+        if has_hash and has_file and has_par2_files:
+            valid_count += 1
+            if not include_valid:
+                continue
+        rel_filename = Path(rel_name)
+        results.append(FileStatus(filename=root / rel_filename, rel_filename=rel_filename,
+                                  has_hash=has_hash, has_par2_files=has_par2_files, has_file=has_file))
+    return valid_count, sorted(results, key=lambda v: (v.has_hash, v.has_file, v.has_par2_files, v.rel_filename))
 
 parser = argparse.ArgumentParser(
     description="Handles data on pairs of PAR2-protected hard drives."
@@ -326,6 +711,9 @@ parser.add_argument('--root', '-r', action='append', required=True)
 subparsers = parser.add_subparsers(help='sub-command help', dest='subparser_type', required=True)
 init_parser = subparsers.add_parser('init', help='Initialize a pair of backup drives')
 init_parser.add_argument('--base-name', required=True)
+init_parser.add_argument('--hash-algo', choices=HASH_ALGORITHMS, default='sha256',
+    help='Hash algorithm for the backup set. sha256 (the default) can be checked by hand with standard tools; '
+    'blake2b and blake3 (requires the blake3 package) are faster on CPUs without SHA extensions')
 
 list_parser = subparsers.add_parser('list', help='Lists the files and their current backup status')
 list_parser.add_argument('--all', action='store_true')
@@ -337,6 +725,17 @@ add_parser.add_argument('--reuse-parity', action='store_true', default=False)
 add_parser.add_argument('file')
 
 verify_parser = subparsers.add_parser('verify', help='Verifies all files in the manifest')
+verify_parser.add_argument('--full', action='store_true', default=False,
+    help='Re-hash every file, even ones unchanged since a recent successful verification')
+verify_parser.add_argument('--recheck-days', default=30, type=float,
+    help='Re-hash files unchanged since their last successful verification only if it was at least this many days ago')
+verify_parser.add_argument('--jobs', '-j', default=1, type=int,
+    help='Number of files to verify at once on each drive. Drives are always verified in parallel. '
+    'Keep this at 1 for hard drives, where concurrent reads cause seeking; raise it for SSDs')
+verify_parser.add_argument('--par2-only', action='store_true', default=False,
+    help='Skip the hash check entirely and only run `par2 verify`, which reads each file once instead of twice')
+verify_parser.add_argument('--fast-fail', action='store_true', default=False,
+    help='Stop `par2 verify` on a file as soon as its hash check fails, instead of also checking its recovery data')
 
 if __name__ == '__main__':
     repo_root = Path(__file__).parent
@@ -346,7 +745,7 @@ if __name__ == '__main__':
     if args.subparser_type == 'init':
         root_names = [f'{args.base_name}_{i + 1}' for i in range(len(args.root))]
         for root, name in zip(args.root, root_names):
-            init_paired_backups(Path(root), name, root_names)
+            init_paired_backups(Path(root), name, root_names, args.hash_algo)
     else:
 
         drive_roots: List[Tuple[Path, DataManifest]] = []
@@ -378,27 +777,30 @@ if __name__ == '__main__':
         # Check that versions are all equal
         if len({p[1].version for p in drive_roots}) > 1:
             raise RuntimeError("Manifest versions differ! You should compare manifests to figure out what happened (with a diff tool like git diff)")
+        # Check that hash algorithms are all equal
+        if len({p[1].algo for p in drive_roots}) > 1:
+            raise RuntimeError("Manifest hash algorithms differ! You should compare manifests to figure out what happened (with a diff tool like git diff)")
         # Check that files match across manifests
-        if len({tuple([(k, p[1].files[k]) for k in sorted(p[1].files.keys()) ]) for p in drive_roots}) > 1:
+        if len({_manifest_fingerprint(p[1].files) for p in drive_roots}) > 1:
             raise RuntimeError("Tracked files do not match! You should compare the manifests to figure out what happened (with a diff tool like git diff)")
         
+        # Locate par2 once up front (the result is cached), so that a missing par2
+        # fails immediately instead of after the first file has been hashed.
+        if args.subparser_type in ('add', 'verify'):
+            print(f'Using par2 at {str(locate_par2())}')
+
         # Implement other subparsers
         if args.subparser_type == 'list':
             for root, manifest in drive_roots:
-                file_list = list_files(root, manifest)
-                valid_count = 0
+                valid_count, file_list = list_files(root, manifest, include_valid=args.all)
                 print(f'{manifest.name} ({str(root)}) files:')
                 for file in file_list:
-                    valid = file.has_hash and file.has_par2_files and file.has_file
-                    if valid:
-                        valid_count += 1
-                    if args.all or not valid:
-                        print('{} {} {} {}'.format(
-                            '[NO HASH]' if not file.has_hash else '',
-                            '[NO PARITY]' if not file.has_par2_files else '',
-                            '[MISSING]' if not file.has_file else '',
-                            str(file.rel_filename)
-                        ))
+                    print('{} {} {} {}'.format(
+                        '[NO HASH]' if not file.has_hash else '',
+                        '[NO PARITY]' if not file.has_par2_files else '',
+                        '[MISSING]' if not file.has_file else '',
+                        str(file.rel_filename)
+                    ))
                 if not args.all:
                     print(f'{valid_count} valid tracked files not shown. Use --all to list all.')
 
@@ -410,17 +812,38 @@ if __name__ == '__main__':
                     'sure you know what you are doing. The manifest divergence will throw errors unless '
                     'you fix it.')
 
-            # Check that the passed path is a relative path and exists on all drives.
-            next_block = 0
+            # Check that the passed path is a relative path, exists on all drives, and can be added.
+            # These checks are cheap, so they all run before any hashing starts.
+            reuse_existing: List[bool] = []
             for root, manifest in drive_roots:
                 if not (root / args.file).exists() or not (root / args.file).is_file():
                     raise RuntimeError(f"File to add ({str(args.file)}) does not exist on drive {manifest.name} ({root})!\n"
                         "Are you sure you specified a drive-relative path? It should look like `data/foo.zip` without leading entries.")
-            
-                next_block = add_file(root, manifest, root / args.file, parity_percent=args.parity_percent, reuse_parity=args.reuse_parity, start_block=next_block)
+                reuse_existing.append(check_addable(root, manifest, Path(args.file), reuse_parity=args.reuse_parity))
+
+            # Hash the file on every drive concurrently. Each drive is independent I/O,
+            # and hashlib releases the GIL while hashing, so threads are sufficient.
+            # Meanwhile, par2 creates parity data in the main thread. The par2 runs have to happen
+            # one drive at a time, as each drive's recovery blocks start where the previous drive's ended.
+            with ThreadPoolExecutor(max_workers=len(drive_roots)) as pool:
+                print(f'Computing hash for {str(args.file)} on {len(drive_roots)} drive(s)...', flush=True)
+                hash_futures = [pool.submit(hash_file_with_progress, root / args.file, algo=manifest.algo, show_progress=False)
+                                for root, manifest in drive_roots]
+                next_block = 0
+                for (root, manifest), reuse in zip(drive_roots, reuse_existing):
+                    par2_process = None if reuse else start_parity(manifest, root / args.file, parity_percent=args.parity_percent,
+                                                                   start_block=next_block)
+                    next_block = finish_parity(root, root / args.file, par2_process)
+
+                for (root, manifest), future in zip(drive_roots, hash_futures):
+                    filehash = future.result()
+                    print(f'[{manifest.name}] Hashed {str(args.file)}: {filehash.hex()}', flush=True)
+                    manifest.files[Path(args.file)] = filehash
+                    # Both the hash and par2 are done reading the file
+                    drop_cached_pages(root / args.file)
             
             # Check that all files share the same hash
-            file_hashes: set[str] = set()
+            file_hashes: set[bytes] = set()
             for root, manifest in drive_roots:
                 if Path(args.file) not in manifest.files:
                     raise RuntimeError(f"Something went wrong! File was not added to {manifest.name} ({root})'s manifest!")
@@ -433,10 +856,35 @@ if __name__ == '__main__':
 
         elif args.subparser_type == 'verify':
             failed = False
-            for root, manifest in drive_roots:
-                for file in manifest.files:
-                    if not verify_file(root, manifest, root / file):
+            # par2cmdline only verifies one recovery set per invocation, so instead of batching
+            # par2 calls, each file is fully verified (hash and par2) by a worker. Each drive gets
+            # its own pool of `--jobs` workers, so the drives always run in parallel without one
+            # drive's work stealing workers from another. Results are still reported in file order.
+            # All manifests were checked to match above.
+            file_list = sorted(drive_roots[0][1].files)
+            verify_caches = {root: load_verify_cache(root) for root, _ in drive_roots}
+            max_cache_age = 0.0 if args.full else args.recheck_days * 24 * 60 * 60
+            show_progress = len(drive_roots) == 1 and args.jobs == 1
+            drive_pools = {root: ThreadPoolExecutor(max_workers=args.jobs) for root, _ in drive_roots}
+            try:
+                futures = [drive_pools[root].submit(verify_file, root, manifest, rel_file, show_progress=show_progress,
+                                                    verify_cache=verify_caches[root], max_cache_age=max_cache_age,
+                                                    check_hash=not args.par2_only, deep=not args.fast_fail)
+                           for rel_file in file_list
+                           for root, manifest in drive_roots]
+                for future in futures:
+                    if not future.result():
                         failed = True
+            finally:
+                # Cancel the queued files on every drive before waiting on any of them, so that
+                # no drive starts a new file while another drive's running file is finishing
+                for pool in drive_pools.values():
+                    pool.shutdown(wait=False, cancel_futures=True)
+                for pool in drive_pools.values():
+                    pool.shutdown(wait=True)
+                # Save progress even if interrupted, so a re-run can skip what was already hashed
+                for root, verify_cache in verify_caches.items():
+                    save_verify_cache(root, verify_cache)
             if failed:
                 print('File verification failed!')
                 sys.exit(1)